@@ -0,0 +1,112 @@
+# cython: language_level=3
+# cython: boundscheck=False, wraparound=False
+'''
+Optional Cython fast path for the Coretronics Venus3 driver: the CRC and
+frame assembly run as straight-line C instead of interpreted byte loops.
+coretronics_venus3.py picks this module up automatically when it has been
+built; nothing else imports it directly.
+
+Build in place with:
+    python setup.py build_ext --inplace
+'''
+
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+cdef unsigned short CRC_TABLE[256]
+
+cdef void _init_table() noexcept:
+    cdef unsigned int i, j, c
+    for i in range(256):
+        c = i << 8
+        for j in range(8):
+            c = ((c << 1) ^ 0x1021) & 0xFFFF if c & 0x8000 else (c << 1) & 0xFFFF
+        CRC_TABLE[i] = <unsigned short>c
+
+_init_table()
+
+cdef const char* HEXD = "0123456789ABCDEF"
+
+
+cpdef unsigned short crc16_ccitt(const unsigned char[::1] buf):
+    """CRC-16/CCITT (poly 0x1021, init 0, no reflection, no final XOR)."""
+    cdef unsigned short crc = 0
+    cdef Py_ssize_t i
+    for i in range(buf.shape[0]):
+        crc = ((crc << 8) ^ CRC_TABLE[((crc >> 8) ^ buf[i]) & 0xFF]) & 0xFFFF
+    return crc
+
+
+cdef inline int _unhex(unsigned char c) except -1:
+    if 48 <= c <= 57:   return c - 48    # '0'..'9'
+    if 65 <= c <= 70:   return c - 55    # 'A'..'F'
+    if 97 <= c <= 102:  return c - 87    # 'a'..'f'
+    raise ValueError("Invalid hex digit in response!")
+
+
+cpdef tuple parse_response(const unsigned char[::1] resp):
+    """Parses one raw response frame (HEAD to CRC, EOL stripped).
+    Returns (cmd, wg, payload bytes) with cmd and wg as ints."""
+    cdef Py_ssize_t n = resp.shape[0]
+    cdef Py_ssize_t last = n - 1, i, pos
+    cdef unsigned short crc = 0
+    cdef int length = 0
+    cdef int cmd, wg, crc_read
+    cdef unsigned char pbuf[256]
+    assert n >= 8 and resp[0] == c'#', \
+        "First character of response [HEAD] expected to be '#'!"
+    while last > 0 and resp[last] != c',':
+        last -= 1
+    assert 0 < last <= n - 3, "Malformed response!"
+    crc_read = (_unhex(resp[last+1]) << 4) | _unhex(resp[last+2])
+    for i in range(last + 1):
+        crc = ((crc << 8) ^ CRC_TABLE[((crc >> 8) ^ resp[i]) & 0xFF]) & 0xFFFF
+    assert crc_read == (crc & 0xFF), "CRC mismatch!"
+    cmd = (_unhex(resp[1]) << 4) | _unhex(resp[2])
+    wg = resp[4] - c'0'
+    pos = 6
+    while pos < last and resp[pos] != c',':
+        length = (length << 4) | _unhex(resp[pos])
+        pos += 1
+    assert length <= 255, "Payload too long!"
+    # The declared length is CRC-covered but not trusted: a glitched frame
+    # may announce more fields than it carries, and with bounds checking
+    # compiled out the loop below must never read past the final comma.
+    assert pos + 3 * length <= last, "Malformed response!"
+    for i in range(length):
+        pos += 1    # skip the comma
+        pbuf[i] = <unsigned char>((_unhex(resp[pos]) << 4) | _unhex(resp[pos+1]))
+        pos += 2
+    return cmd, wg, PyBytes_FromStringAndSize(<const char*>pbuf, length)
+
+
+cpdef bytes build_frame(unsigned char cmd_idx, const unsigned char[::1] payload,
+                        unsigned char wg):
+    """Renders one complete command frame, HEAD to EOL, CRC included."""
+    # Worst case: 8 header chars + 3 chars per payload byte + 4 trailer chars.
+    cdef unsigned char buf[800]
+    cdef Py_ssize_t n = payload.shape[0]
+    cdef Py_ssize_t pos = 0, i
+    cdef unsigned short crc = 0
+    cdef unsigned char b
+    assert n <= 255, "Payload too long!"
+    buf[pos] = b'#';                 pos += 1
+    buf[pos] = HEXD[cmd_idx >> 4];   pos += 1
+    buf[pos] = HEXD[cmd_idx & 0xF];  pos += 1
+    buf[pos] = b',';                 pos += 1
+    buf[pos] = wg;                   pos += 1
+    buf[pos] = b',';                 pos += 1
+    if n >= 16:
+        buf[pos] = HEXD[n >> 4];     pos += 1
+    buf[pos] = HEXD[n & 0xF];        pos += 1
+    for i in range(n):
+        b = payload[i]
+        buf[pos] = b',';             pos += 1
+        buf[pos] = HEXD[b >> 4];     pos += 1
+        buf[pos] = HEXD[b & 0xF];    pos += 1
+    buf[pos] = b',';                 pos += 1
+    for i in range(pos):
+        crc = ((crc << 8) ^ CRC_TABLE[((crc >> 8) ^ buf[i]) & 0xFF]) & 0xFFFF
+    buf[pos] = HEXD[(crc >> 4) & 0xF];  pos += 1
+    buf[pos] = HEXD[crc & 0xF];         pos += 1
+    buf[pos] = b'\0';                   pos += 1
+    return PyBytes_FromStringAndSize(<const char*>buf, pos)
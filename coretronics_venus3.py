@@ -1,62 +1,383 @@
 from matplotlib.transforms import BlendedAffine2D
+import array
+import functools
+import os
+import struct
 import serial
 from serial.tools import list_ports
-import crcmod    # if you encounter an error here, pip install crcmod
+try:
+    import serial_asyncio    # pip install pyserial-asyncio; only needed for the async driver
+except ImportError:
+    serial_asyncio = None
 
 '''
 Low-level driver functions for the Coretronics Venus3 stereo DLP driver PCBA.
 Connect the PCBA to a USB port to power the PCBA. After successful enumeration,
-a virtual COM-port is established via which the TI3433 DLP controller can be 
+a virtual COM-port is established via which the TI3433 DLP controller can be
 accessed.
 '''
 
+# CRC-16 CCITT check sum of whole package from HEAD to PAYLOAD including commas
+# http://srecord.sourceforge.net/crc16-ccitt.html
+# CRC "polynomial" is 0x1021 and initial value is 0 and "final XOR value" is 0.
+# Table-driven, one lookup per byte; the 256-entry table is built once at
+# import and stored as a compact uint16 array.
+def _make_crc_table():
+    table = array.array('H', [0]*256)
+    for i in range(256):
+        c = i << 8
+        for _ in range(8):
+            c = ((c << 1) ^ 0x1021) & 0xFFFF if c & 0x8000 else (c << 1) & 0xFFFF
+        table[i] = c
+    return table
+_CRC_TABLE = _make_crc_table()
+
+def _crc16_update(crc, buf):
+    # Resumable form: feeds buf into an existing CRC state, so a constant
+    # message prefix can be checksummed once and continued from.
+    for b in buf:
+        crc = ((crc << 8) & 0xFFFF) ^ _CRC_TABLE[((crc >> 8) ^ b) & 0xFF]
+    return crc
+
+def _crc16(buf):
+    return _crc16_update(0, buf)
+
+# Nibble-table alternative: two lookups per byte against a 16-entry (32 B)
+# table instead of one against the 512 B byte table. Set _USE_NIBBLE_CRC
+# on tiny embedded hosts where the smaller table is worth the extra lookup.
+def _make_crc_nib_table():
+    table = array.array('H', [0]*16)
+    for i in range(16):
+        c = i << 12
+        for _ in range(4):
+            c = ((c << 1) ^ 0x1021) & 0xFFFF if c & 0x8000 else (c << 1) & 0xFFFF
+        table[i] = c
+    return table
+_CRC16_CCITT_NIB = _make_crc_nib_table()
+
+def _crc16_nib(buf):
+    crc = 0
+    nib = _CRC16_CCITT_NIB
+    for b in buf:
+        crc = (nib[((crc >> 12) ^ (b >> 4)) & 0xF] ^ (crc << 4)) & 0xFFFF
+        crc = (nib[((crc >> 12) ^ b) & 0xF] ^ (crc << 4)) & 0xFFFF
+    return crc
+
+_USE_NIBBLE_CRC = False
+
+# Optional native CRC backend (see crc16_ccitt_clmul.c). If the compiled
+# shared library sits next to this module, use it; frames are short, but
+# bulk payloads such as splash screens benefit from the C (and, on x86,
+# PCLMULQDQ-folded) inner loop. Falls back to the Python table otherwise.
+try:
+    import ctypes as _ctypes, os as _os
+    _crclib = _ctypes.CDLL(_os.path.join(
+        _os.path.dirname(_os.path.abspath(__file__)), '_crc16_ccitt.so'))
+    _crclib.crc16_ccitt.restype = _ctypes.c_uint16
+    _crclib.crc16_ccitt.argtypes = [_ctypes.c_char_p, _ctypes.c_size_t]
+    def _crc16_native(buf):
+        return _crclib.crc16_ccitt(bytes(buf), len(buf))
+    _crc16_impl = _crc16_native
+except OSError:
+    _crc16_impl = _crc16_nib if _USE_NIBBLE_CRC else _crc16
+
+# The Cython fast path (see _venus3_fast.pyx, built via setup.py) compiles
+# both the CRC and the frame assembly; prefer it over the ctypes backend
+# when available.
+try:
+    from _venus3_fast import crc16_ccitt as _crc16_impl, \
+                             build_frame as _build_frame_fast, \
+                             parse_response as _parse_response_fast
+except ImportError:
+    _build_frame_fast = None
+    _parse_response_fast = None
+
+# Two ASCII hex characters -> byte value, for parsing response fields without
+# a decode()/int() round trip per field. Device frames are uppercase, but
+# accept lowercase tokens as well.
+_FROM_HEX2 = {b"%02X" % i: i for i in range(256)}
+_FROM_HEX2.update({b"%02x" % i: i for i in range(256)})
+
+# Shared empty payload for query commands, instead of a fresh bytes()
+# temporary per call.
+_EMPTY = b''
+
+# ---------------------------------------------------------------------------
+# Response payload decoders. Each takes the list of payload bytes returned by
+# _parse_response and produces the value(s) the corresponding public getter
+# documents. They are referenced from the _CMD_META table below.
+# ---------------------------------------------------------------------------
+
+# Little-endian field unpackers (C-level, via struct) shared by the decoders.
+_RGB = struct.Struct('<HHH').unpack
+_RGB_PACK = struct.Struct('<HHH').pack
+_RGB_PACK_INTO = struct.Struct('<HHH').pack_into
+_TINT_PACK = struct.Struct('<BHHH').pack
+_U16 = struct.Struct('<H').unpack_from
+_U32 = struct.Struct('<I').unpack_from
+
+@functools.lru_cache(maxsize=256)
+def _zero_payload_frame(cmd_idx, wg):
+    # Query commands carry no payload, so their whole frame - CRC included -
+    # is a constant per (command, channel) pair; render it once and reuse.
+    head = b'#%02X,%s,0,' % (cmd_idx, wg.encode('ascii'))
+    return head + b'%02X' % (_crc16_impl(head) & 0xFF) + b'\0'
+
+@functools.lru_cache(maxsize=None)
+def _frame_prefix(cmd_idx, wg):
+    # The '#CC,W,' head of a command frame never varies per (command,
+    # channel) pair; render it once together with the CRC state it leaves
+    # behind, so per-packet work starts at the variable tail.
+    prefix = b'#%02X,%s,' % (cmd_idx, wg.encode('ascii'))
+    return prefix, _crc16_update(0, prefix)
+
+def _strip_debug_lines(line):
+    # Responses can be inconsistent. Sometimes /n/r terminated
+    # debug messages are printed onto the UART. In debug mode,
+    # print these messages to the console, otherwise discard.
+    # Scans by index so a frame preceded by many debug lines is not
+    # re-sliced (and re-allocated) once per line.
+    start = 0
+    while True:
+        cr = line.find(b'\r', start)
+        if cr < 0:
+            return line[start:] if start else line
+        if __debug__: print(line[start:max(cr-1, start)].decode())
+        start = cr + 1
+
+def _dec_u8(byte_list):
+    return byte_list[0]
+
+def _dec_bit0(byte_list):
+    return (byte_list[0] & 1) > 0
+
+def _dec_source(byte_list):
+    source = byte_list[0]
+    assert source in (0, 1, 2), "Unknown input source reported!"
+    return source
+
+def _dec_orientation(byte_list):
+    byte = byte_list[0]
+    flip_y = (byte & 4) > 0
+    flip_x = (byte & 2) > 0
+    rot_90 = (byte & 1) > 0
+    return flip_x, flip_y, rot_90
+
+def _dec_rgb16(byte_list):
+    return _RGB(byte_list[:6])
+
+def _dec_look(byte_list):
+    look_id = byte_list[0]
+    sequence_id = byte_list[1]
+    frame_rate_int = _U32(byte_list, 2)[0]
+    return look_id, sequence_id, frame_rate_int
+
+def _dec_rgb_enable(byte_list):
+    byte = byte_list[0]
+    red_enabled =   (byte & 0x01) > 0
+    green_enabled = (byte & 0x02) > 0
+    blue_enabled =  (byte & 0x04) > 0
+    return red_enabled, green_enabled, blue_enabled
+
+def _dec_labb(byte_list):
+    byte_1 = byte_list[0]
+    sharpness = byte_1 >> 4
+    LABB_control = byte_1 & 0x03
+    LABB_manual_setting = byte_list[1]
+    LABB_gain = byte_list[2]
+    return [sharpness, LABB_control, LABB_manual_setting, LABB_gain]
+
+def _dec_asic_id(byte_list):
+    device_id = byte_list[0]
+    if (device_id == 0): return 'DLP3430'
+    if (device_id == 1): return 'DLP3433'
+    if (device_id == 4): return 'DLP3435'
+    raise ValueError("Unknown device ID {0:#x}!".format(device_id))
+
+def _dec_dmd_id(byte_list):
+    device_id = byte_list[0] & 0x07
+    type = _U32(byte_list, 0)[0]
+    return device_id, hex(type)[2:].upper()
+
+def _dec_flash_version(byte_list):
+    return "{0}.{1}.{2}".format( byte_list[3], byte_list[2], hex(_U16(byte_list, 0)[0])[2:].upper())
+
+# Per-command metadata, keyed by command index:
+# (BOTH channel allowed, response is a bare ACK, payload decoder).
+# Keeping this as one table lets every public method share the single _txn
+# hot path instead of repeating channel checks and response handling.
+_CMD_META = {
+    0x05: (True,  True,  None),                 # set_input_source
+    0x06: (False, False, _dec_source),          # get_input_source
+    0x0B: (True,  True,  None),                 # set_test_pattern
+    0x14: (True,  True,  None),                 # set_image_orientation
+    0x15: (False, False, _dec_orientation),     # get_image_orientation
+    0x1A: (True,  True,  None),                 # set_image_freeze
+    0x1B: (False, False, _dec_bit0),            # get_image_freeze
+    0x22: (True,  True,  None),                 # set_look
+    0x23: (False, False, _dec_look),            # get_look
+    0x25: (True,  True,  None),                 # set_RGB_duty_cycle
+    0x26: (False, False, _dec_rgb16),           # get_RGB_duty_cycle
+    0x27: (True,  True,  None),                 # set_gamma
+    0x28: (False, False, _dec_u8),              # get_gamma
+    0x50: (True,  True,  None),                 # set_CAIC_enable
+    0x51: (False, False, _dec_bit0),            # get_CAIC_enable
+    0x52: (True,  True,  None),                 # set_RGB_enable
+    0x53: (False, False, _dec_rgb_enable),      # get_RGB_enable
+    0x54: (True,  True,  None),                 # set_RGB_currents
+    0x55: (False, False, _dec_rgb16),           # get_RGB_currents
+    0x80: (True,  True,  None),                 # set_brightness_boost
+    0x81: (False, False, _dec_labb),            # get_brightness_boost
+    0xD4: (False, False, _dec_asic_id),         # get_ASIC_device_ID
+    0xD5: (False, False, _dec_dmd_id),          # get_DMD_device_ID
+    0xD9: (False, False, _dec_flash_version),   # get_DLP_flash_version
+    0xF9: (True,  True,  None),                 # write_tint_to_flash
+    0xFA: (True,  True,  None),                 # write_orientation_to_flash
+}
+
 class coretronics_venus3:
     
     #####################################################################
     # Private members of the class, setting up communication mechanisms #
     #####################################################################
 
-    def __init__(self):
+    # Byte value -> two uppercase hex digits, precomputed once.
+    _HEX = [b'%02X' % i for i in range(256)]
+    _HEX2 = tuple("%02X" % i for i in range(256))
+    _HEXDIGITS = b'0123456789ABCDEF'
+
+    # Valid channel selectors: read/write commands accept a single side
+    # only, write-only commands may also address BOTH.
+    _CH_RW = frozenset(('0', '1'))
+    _CH_W  = frozenset(('0', '1', '2'))
+
+    def __init__(self, low_latency=False):
         self.ser = 0
         self.PCBA_NAME = "Coretronics Venus3"
+        # low_latency=True asks the OS to flush the USB-serial receive
+        # buffer immediately instead of on its (typically 16 ms) latency
+        # timer, cutting every request/ACK round trip accordingly. Opt-in,
+        # as it is a host-wide setting for the port.
+        self.low_latency = low_latency
         self.isOpen = self._open_serial()
+        # Receive buffer: responses are drained from the port in bulk and
+        # carved into lines here, instead of one read() syscall per byte.
+        self._rxbuf = bytearray()
+        # ACK-only commands already written to the port but not yet
+        # confirmed; drained by flush() or before the next query.
+        self._pending = []
+        # Parsed query responses, one slot per byte-sized command ID.
+        self._responses = [None]*256
+        # Scratch buffer for 3x uint16 payloads, reused across calls.
+        self._rgb_buf = bytearray(6)
+        self.crc_fun = _crc16_impl
+
+    def close(self):
+        """ Releases the virtual COM port. Safe to call repeatedly, and a
+            no-op when the port never opened in the first place.
+        """
+        if isinstance(self.ser, serial.Serial) and self.ser.is_open:
+            self.ser.close()
+        self.isOpen = False
 
-        # CRC-16 CCITT check sum of whole package from HEAD to PAYLOAD including commas
-        # http://srecord.sourceforge.net/crc16-ccitt.html
-        # CRC “polynomial” is 0x1021 and initial value is 0 and “final XOR value” is 0.
-        self.crc_fun = crcmod.mkCrcFun(0x11021, rev=False, initCrc=0x0000, xorOut=0x0000)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __del__(self):
-        """RAII: release the virtual COM port when the coretronics instance goes out of scope."""
-        if self.ser.isOpen():
-            self.ser.close()
+        """ Last-resort release of the COM port; prefer the context manager
+            (with coretronics_venus3() as dlp: ...), which closes
+            deterministically instead of relying on garbage collection.
+        """
+        self.close()
+
+    # The device path of the last successful open; probing it first skips
+    # the COM port enumeration (slow on Windows) for short-lived scripts.
+    _PORT_CACHE = os.path.expanduser('~/.coretronics_port')
 
     def _open_serial(self):
-        """ Opens the serial port to the Coretronics device
+        """ Opens the serial port to the Coretronics device.
+            The cached device path is tried first; on a miss the available
+            COM ports are enumerated and the hit is cached for next time.
         """
-        for port in list_ports.comports():
-            if port.description.find('EVK1XXX Virtual Com Port') == 0:
-                self.ser = serial.Serial(
-                    port=port.device,
-                    baudrate=115200,
-                    parity=serial.PARITY_NONE,
-                    stopbits=serial.STOPBITS_ONE,
-                    bytesize=serial.EIGHTBITS,
-                    timeout = 0.5)
+        try:
+            with open(self._PORT_CACHE) as f:
+                cached = f.read().strip()
+            if cached and self._try_open(cached):
                 return True
-        assert "Coretronic Device Not Found!"
-        return False
+        except OSError:
+            pass
+        for port in list_ports.comports():
+            if port.description.startswith('EVK1XXX Virtual Com Port'):
+                if self._try_open(port.device):
+                    try:
+                        tmp = self._PORT_CACHE + '.tmp'
+                        with open(tmp, 'w') as f:
+                            f.write(port.device)
+                        os.replace(tmp, self._PORT_CACHE)
+                    except OSError:
+                        pass
+                    return True
+        # Fail fast: a missing device would otherwise surface as a string
+        # of read timeouts on the first command.
+        raise RuntimeError("Coretronic Device Not Found!")
+
+    def _try_open(self, device):
+        try:
+            self.ser = serial.Serial(
+                port=device,
+                baudrate=115200,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+                bytesize=serial.EIGHTBITS,
+                timeout = 0.5,
+                write_timeout = 0.5,
+                exclusive = True if os.name == 'posix' else None)
+        except serial.SerialException:
+            return False
+        if self.low_latency:
+            try:
+                self.ser.set_low_latency_mode(True)
+            except Exception:
+                # Not a pyserial platform backend that supports the ioctl;
+                # fall back to the usb-serial sysfs knob on Linux.
+                try:
+                    sysfs = '/sys/bus/usb-serial/devices/{0}/latency_timer'.format(
+                        os.path.basename(device))
+                    with open(sysfs, 'w') as f:
+                        f.write('1')
+                except OSError:
+                    pass
+        # On Windows, grow the kernel RX buffer so bursts of short
+        # frames are never dropped between our bulk reads. Other
+        # platforms do not expose this knob.
+        try:
+            self.ser.set_buffer_size(rx_size = 1 << 16)
+        except (AttributeError, NotImplementedError):
+            pass
+        return True
 
     def _to_hex(self, integer, num_result_hex_digits=2):
-        """Convert a byte to a two-digit hex string"""
-        assert isinstance(integer, int) 
-        assert integer == integer & 0xFF
+        """Convert a byte to a two-digit hex string.
+           Deprecated: hot paths index the precomputed _HEX/_HEX2 tables directly.
+        """
+        assert isinstance(integer, int)
+        assert integer == integer & ((1 << (4*num_result_hex_digits)) - 1)
+        if num_result_hex_digits == 2:
+            return self._HEX2[integer]
         padding = 1 << (4*num_result_hex_digits)
-        return hex(padding + integer)[3:]
+        return hex(padding + integer)[3:].upper()
+
+    def _get_crc(self, buf):
+        """Two uppercase ASCII hex digits of the frame CRC's low byte,
+           computed directly over the bytes that go on the wire."""
+        return self._HEX[self.crc_fun(buf) & 0xFF]
 
     def _get_crc_str(self, cmd):
-        crc16 = self.crc_fun(bytearray(cmd, 'ascii'))
-        return self._to_hex(crc16 & 0xFF).upper()
+        """Deprecated str variant of _get_crc; encodes its argument once."""
+        return self._get_crc(bytes(cmd, 'ascii')).decode('ascii')
 
     def _send_command( self, cmd_idx, payload, wg):
         """ Sends a command to via the serial interface.
@@ -65,7 +386,13 @@ class coretronics_venus3:
                 payload : command operands [bytearray]
                 wg      : side selector ( LEFT, RIGHT, or BOTH)
         """
+        self.ser.write(self._build_frame(cmd_idx, payload, wg))
 
+    def _build_frame(self, cmd_idx, payload, wg):
+        """ Assembles one complete command frame (HEAD to EOL) as bytes.
+            The frame is returned whole so the transport can hand it to the
+            port in a single write(), one USB transfer per command.
+        """
         # General command packet structure: [HEAD][CMD],[WG],[LENGTH],[PAYLOAD],[CRC][\0], where
         # [HEAD]      : '#'
         # [CMD]       : two hex characters, from 00 to FF
@@ -73,74 +400,138 @@ class coretronics_venus3:
         # [Length]    : payload length in string format (N)
         # [Payload]   : N bytes of data, Data0 .. Data N-1
         # [CRC]       : The lower byte of the CRC-16.
-
-        payload_str = ""
+        if not payload:
+            return _zero_payload_frame(cmd_idx, wg)
+        if _build_frame_fast is not None:
+            return _build_frame_fast(cmd_idx, payload, ord(wg))
+        # Emit hex nibbles straight into one bytearray; the CRC then runs
+        # over the very buffer that goes to the port, with no intermediate
+        # str or per-byte bytes objects. The constant head and its CRC
+        # state come precomputed from _frame_prefix.
+        hexd = self._HEXDIGITS
+        prefix, crc = _frame_prefix(cmd_idx, wg)
+        buf = bytearray(prefix)
+        buf += b'%X' % len(payload)
         for d in payload:
-            payload_str += ',' + self._to_hex(d)
-        cmd = "#{0},{1},{2}{3},".format(self._to_hex(cmd_idx), wg, str(len(payload)), payload_str).upper()
-        cmd += self._get_crc_str(cmd) + '\0'
-        self.ser.write(bytes(cmd, 'ascii'))
-    
+            buf += b','
+            buf.append(hexd[d >> 4]); buf.append(hexd[d & 0xF])
+        buf += b','
+        crc = _crc16_update(crc, memoryview(buf)[len(prefix):]) & 0xFF
+        buf.append(hexd[crc >> 4]); buf.append(hexd[crc & 0xF])
+        buf += b'\0'
+        return bytes(buf)
+
     def _read_line(self, eol):
-        ret = b''
         while 1:
-            c = self.ser.read()
-            assert len(c)>0, "Response timeout!" 
-            if c==eol: 
-                return ret
-            # Responses can be inconsistent. Sometimes /n/r terminated 
-            # debug messages are printed onto the UART. In debug mode, 
-            # print these messages to the console, otherwise discard.
-            if c == b'\r': 
-                if __debug__: print(ret[:-1].decode())
-                ret = b''
-            else:
-                ret += c
-
-    def _read_response(self, cmd_id, channel, expect_only_ACK=False):       
-        response = ""
-        # Considering serial responses indicate command_id and side, 
+            pos = self._rxbuf.find(eol)
+            if pos >= 0:
+                line = bytes(self._rxbuf[:pos])
+                del self._rxbuf[:pos+len(eol)]
+                return _strip_debug_lines(line)
+            # Drain everything the port has buffered in one read; only
+            # block for a single byte when nothing is waiting yet.
+            ser = self.ser
+            chunk = ser.read(max(1, ser.in_waiting))
+            assert len(chunk)>0, "Response timeout!"
+            self._rxbuf += chunk
+
+    def _read_response(self, cmd_id, channel, expect_only_ACK=False):
+        # Considering serial responses indicate command_id and side,
         # the Venus may, in theory respond to queries out-of-order.
-        # However, ACK after response indicates completion of command,
-        # suggesting a simple response/reply (pull model) protocol.
+        # Every parsed frame is parked in the per-command slot of
+        # _responses (plain int indexing, command IDs are byte-sized);
+        # the ACK closing the transaction picks our answer out of its slot,
+        # so a straggler for a different command cannot derail the match.
         while 1:
-            c = self._read_line(eol=b'\0')
-            response = c.decode()
-            assert response[0] == '#', "First character of response [HEAD] expected to be '#'!" 
-            assert response[1] != 'N', "Command NACK received!"
-            if response[1]=='A':                     
+            resp = self._read_line(eol=b'\0')
+            # Header checks on the raw bytes; no decode needed just to
+            # compare two characters. 0x41 is 'A', 0x4E is 'N'.
+            assert resp[0:1] == b'#', "First character of response [HEAD] expected to be '#'!"
+            tag = resp[1]
+            assert tag != 0x4E, "Command NACK received!"
+            if tag == 0x41:
                 if expect_only_ACK: return
+                slot = self._responses[cmd_id]
+                assert slot is not None, "Mismatch between queried command ID and response ID!"
+                self._responses[cmd_id] = None
+                wg, byte_list = slot
+                assert wg==int(channel), "Mismatch between command and response channel IDs!"
                 return byte_list
-            else: 
-                cmd, wg, byte_list = self._parse_response(response)
-                assert cmd_id==int(cmd,16), "Mismatch between queried command ID and response ID!"
-                assert int(wg)==int(channel), "Mismatch between command and response channel IDs!"
-     
+            cmd, wg, byte_list = self._parse_response(resp)
+            self._responses[cmd] = (wg, byte_list)
+
     def _parse_response(self, response):
-        assert response[0] == '#', "First character of response [HEAD] expected to be '#'!" 
-        try:
-            last_comma_pos = response.rfind(',')
-            crc_read = int(response[last_comma_pos+1:], 16)
-            crc_calc = self.crc_fun(bytes(response[0:last_comma_pos+1], 'ascii')) & 0xFF
-            chunks = response[1:].split(',')
-            cmd = chunks[0]
-            wg  = chunks[1]
-            length = int(chunks[2], 16)
-            payload = [int(i,16) for i in chunks[3:3+length]]
-            assert  crc_read == crc_calc, "CRC mismatch!" 
-            return cmd, wg, payload
-        except:
-            assert ValueError("Error parsing read response from {}!".format(self.PCBA_NAME))
-        return
-
-    def _get_rgb(self, byte_list):
-        R = (byte_list[1]*256 + byte_list[0])
-        G = (byte_list[3]*256 + byte_list[2])
-        B = (byte_list[5]*256 + byte_list[4])
-        return R,G,B
+        """ Parses a raw response frame (bytes, HEAD to CRC, EOL stripped).
+            Returns (cmd, wg, payload bytes) with cmd and wg as ints.
+            Fields are decoded at the bytes level via the _FROM_HEX2 table;
+            no str round trip is needed.
+        """
+        if _parse_response_fast is not None:
+            return _parse_response_fast(response)
+        assert response[0:1] == b'#', "First character of response [HEAD] expected to be '#'!"
+        last_comma_pos = response.rfind(b',')
+        crc_read = _FROM_HEX2[response[last_comma_pos+1:last_comma_pos+3]]
+        crc_calc = self.crc_fun(response[0:last_comma_pos+1]) & 0xFF
+        chunks = response[1:last_comma_pos].split(b',')
+        cmd = _FROM_HEX2[chunks[0]]
+        wg  = int(chunks[1])
+        length = int(chunks[2], 16)
+        # One C-level hex decode for the whole payload instead of a
+        # per-byte Python loop.
+        payload = bytes.fromhex(b''.join(chunks[3:3+length]).decode('ascii'))
+        assert  crc_read == crc_calc, "CRC mismatch!"
+        return cmd, wg, payload
+
+    def _txn(self, cmd_id, payload, channel, defer=False):
+        """ One generic command transaction: validates the channel against
+            the _CMD_META table, sends the frame, then reads and decodes the
+            response. Returns the decoded payload, or None for ACK-only
+            commands. With defer=True an ACK-only command is only queued;
+            its ACK is collected by the next flush().
+        """
+        allow_both, ack_only, decoder = _CMD_META[cmd_id]
+        if channel not in (self._CH_W if allow_both else self._CH_RW):
+            raise ValueError(channel)
+        if ack_only:
+            # Fire-and-queue: the command goes onto the wire immediately,
+            # and with defer=True several back-to-back set-commands share
+            # one round-trip window, drained together on flush().
+            self._send_command(cmd_id, payload, channel)
+            self._pending.append((cmd_id, channel))
+            if not defer:
+                self.flush()
+            return
+        self.flush()
+        self._send_command(cmd_id, payload, channel)
+        return decoder(self._read_response(cmd_id, channel))
+
+    def flush(self):
+        """ Waits for the ACK of every deferred set-command issued so far.
+            Queries flush implicitly; call this after a batch of
+            defer=True set-commands to confirm the device accepted them all.
+        """
+        pending, self._pending = self._pending, []
+        for cmd_id, channel in pending:
+            self._read_response(cmd_id, channel, expect_only_ACK=True)
+
+    def bind(self, channel):
+        """ Returns a view of this driver with the channel argument fixed,
+            validated once up front. Useful for loops that stream many
+            commands to the same side:
+                left = dlp.bind(dlp.LEFT)
+                left.set_look(1)
+        """
+        if channel not in self._CH_W:
+            raise ValueError(channel)
+        return _BoundSide(self, channel)
 
     def _set_rgb(self, R,G,B):
-        return bytes([R & 0xFF, R >> 8, G & 0xFF, G >> 8, B & 0xFF, B >> 8])        
+        # Packs into the reusable scratch buffer; the synchronous driver
+        # renders the frame before the setter returns, so the buffer is
+        # consumed before the next _set_rgb call. The async driver
+        # overrides this with a snapshot, as its frames render on await.
+        _RGB_PACK_INTO(self._rgb_buf, 0, R, G, B)
+        return self._rgb_buf
     # --------------------------------------
     # Implementation of public API functions
     # --------------------------------------
@@ -155,7 +546,7 @@ class coretronics_venus3:
     TEST_PATTERN_GENERATOR  = 1
     SPLASH_SCREEN           = 2
 
-    def set_input_source(self, source, channel = LEFT):
+    def set_input_source(self, source, channel = LEFT, defer = False):
         """ Selects source for DLP(s)
             parameters:
                 channel: LEFT, RIGHT or BOTH
@@ -163,14 +554,11 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
-        assert (source == self.EXTERNAL_VIDEO_PORT or  
-                source == self.TEST_PATTERN_GENERATOR or 
-                source == self.SPLASH_SCREEN)
-        cmd_id = 0x05
-        self._send_command(cmd_id, bytes([source]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        if source not in (self.EXTERNAL_VIDEO_PORT,
+                          self.TEST_PATTERN_GENERATOR,
+                          self.SPLASH_SCREEN):
+            raise ValueError(source)
+        return self._txn(0x05, bytes((source,)), channel, defer)
 
     def get_input_source(self, channel = LEFT):
         """ Reads input source setting from the DLP
@@ -179,14 +567,7 @@ class coretronics_venus3:
             returns:
                 source:  EXTERNAL_VIDEO_PORT, TEST_PATTERN_GENERATOR, or SPLASH_SCREEN
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x06
-        self._send_command(cmd_id, bytearray(), channel)
-        source = self._read_response(cmd_id, channel)[0]      
-        assert (source == self.EXTERNAL_VIDEO_PORT or  
-                source == self.TEST_PATTERN_GENERATOR or 
-                source == self.SPLASH_SCREEN)
-        return source
+        return self._txn(0x06, _EMPTY, channel)
 
     COLOR_BARS              = 0
     SOLID_FIELD_WHITE       = 1
@@ -204,7 +585,7 @@ class coretronics_venus3:
     VERTICAL_LINES          = 13
     DIAGONAL_LINES          = 14
 
-    def set_test_pattern(self, pattern, channel = LEFT):
+    def set_test_pattern(self, pattern, channel = LEFT, defer = False):
         """ Selects test pattern for DLP(s)
             parameters:
                 channel: LEFT, RIGHT or BOTH
@@ -213,15 +594,11 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
-        assert isinstance(pattern, int), ValueError(pattern)
-        assert (0 <= pattern <= 14), ValueError(pattern)
-        cmd_id = 0x0B
-        self._send_command(cmd_id, bytes([pattern]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        if not isinstance(pattern, int): raise TypeError(pattern)
+        if not (0 <= pattern <= 14): raise ValueError(pattern)
+        return self._txn(0x0B, bytes((pattern,)), channel, defer)
 
-    def set_image_orientation(self, flip_x, flip_y, rot_90, channel = LEFT):
+    def set_image_orientation(self, flip_x, flip_y, rot_90, channel = LEFT, defer = False):
         """ Sets image orientation for the DLP(s)
             parameters:
                 channel: LEFT, RIGHT or BOTH
@@ -231,15 +608,11 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
         byte = 0
         if flip_y: byte += 4
         if flip_x: byte += 2
         if rot_90: byte += 1
-        cmd_id = 0x14
-        self._send_command(cmd_id, bytes([byte]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        return self._txn(0x14, bytes((byte,)), channel, defer)
     
     def get_image_orientation(self, channel = LEFT):
         """ Reads current image orientation of a DLP
@@ -250,17 +623,9 @@ class coretronics_venus3:
                 flip_y: True or 1indicates that the image needs to be flipped along the short axis.
                 rot_90: True or 1indicates that the image needs to rotated 90 degrees counterclockwise
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x15
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        byte = byte_list[0]
-        flip_y = (byte & 4) > 0
-        flip_x = (byte & 2) > 0
-        rot_90 = (byte & 1) > 0
-        return flip_x, flip_y, rot_90
+        return self._txn(0x15, _EMPTY, channel)
     
-    def set_image_freeze(self, freeze_enabled, channel = LEFT):
+    def set_image_freeze(self, freeze_enabled, channel = LEFT, defer = False):
         """ Freezes / unfreezes image on the DLP(s)
             parameters:
                 channel: LEFT, RIGHT or BOTH
@@ -268,13 +633,9 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
         byte = 0
         if freeze_enabled: byte += 1
-        cmd_id = 0x1A
-        self._send_command(cmd_id, bytes([byte]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        return self._txn(0x1A, bytes((byte,)), channel, defer)
     
     def get_image_freeze(self, channel = LEFT):
         """ Reads the image freezing setting of a DLP.
@@ -283,28 +644,18 @@ class coretronics_venus3:
             returns:
                 freeze_enabled: True or 1 indicates that display image freezing is enabled
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x1B
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        byte = byte_list[0]
-        freeze_enabled = (byte & 1) > 0
-        return freeze_enabled
+        return self._txn(0x1B, _EMPTY, channel)
 
-    def set_look(self, look_id, channel = LEFT):
+    def set_look(self, look_id, channel = LEFT, defer = False):
         """ Sets proprietary display tonality preset
             parameters:
                 look_id: byte
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
-        assert isinstance(look_id, int), ValueError("look_id should be integer!")
-        assert 0 <= look_id <= 255, ValueError("look_id should be in the range of [0..255]!")
-        cmd_id = 0x22
-        self._send_command(cmd_id, bytes([look_id]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        if not isinstance(look_id, int): raise TypeError("look_id should be integer!")
+        if not (0 <= look_id <= 255): raise ValueError("look_id should be in the range of [0..255]!")
+        return self._txn(0x22, bytes((look_id,)), channel, defer)
     
     def get_look(self, channel = LEFT):
         """ Reads the image freezing setting of a DLP.
@@ -315,30 +666,18 @@ class coretronics_venus3:
                 sequence_id: byte
                 frame_rate: unigned int
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x23
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        look_id = byte_list[0]
-        sequence_id = byte_list[1]
-        frame_rate_int = byte_list[2] + (byte_list[3] << 8) +(byte_list[4] << 16) + (byte_list[5] << 24)
-        return look_id, sequence_id, frame_rate_int
+        return self._txn(0x23, _EMPTY, channel)
 
-    def set_RGB_duty_cycle(self, R, G, B, channel = LEFT):
+    def set_RGB_duty_cycle(self, R, G, B, channel = LEFT, defer = False):
         """ Writes R,G,B LED duty cycles of attached DLPs.
             !!!! This is an undocumented feature !!!!
             parameters:
                 channel: LEFT, RIGHT, or BOTH
                 R,G,B: uint16s, proportional to LED duty cycles.
         """
-        for c in [R,G,B]:
-            assert isinstance(c, int), ValueError("R,G,B should be integers!")
-            
-        cmd_id = 0x25
-        payload = self._set_rgb(R,G,B)
-        self._send_command(cmd_id, payload, channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        for c in (R,G,B):
+            if not isinstance(c, int): raise TypeError("R,G,B should be integers!")
+        return self._txn(0x25, self._set_rgb(R,G,B), channel, defer)
 
     def get_RGB_duty_cycle(self, channel = LEFT):
         """ Reads R,G,B LED duty cycles from attached DLP.
@@ -347,14 +686,10 @@ class coretronics_venus3:
             returns
                 [R,G,B] list of uint16s, proportional to LED duty cycle
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x26
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        return self._get_rgb(byte_list)
+        return self._txn(0x26, _EMPTY, channel)
 
     
-    def set_gamma(self, gamma_table_index, channel = LEFT):
+    def set_gamma(self, gamma_table_index, channel = LEFT, defer = False):
         """ Freezes / unfreezes image on the DLP(s)
             parameters:
                 channel: LEFT, RIGHT or BOTH
@@ -362,14 +697,9 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
-        assert isinstance(gamma_table_index, int), ValueError("Index should be an integer!")
-        assert 0 <= gamma_table_index <= 15, ValueError("Max index is 15!")
-
-        cmd_id = 0x27
-        self._send_command(cmd_id, bytes([gamma_table_index]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        if not isinstance(gamma_table_index, int): raise TypeError("Index should be an integer!")
+        if not (0 <= gamma_table_index <= 15): raise ValueError("Max index is 15!")
+        return self._txn(0x27, bytes((gamma_table_index,)), channel, defer)
     
     def get_gamma(self, channel = LEFT):
         """ Reads the image freezing setting of a DLP.
@@ -378,14 +708,9 @@ class coretronics_venus3:
             returns:
                 gamma_table_index: 4 bit value to gamma select one of the predefined gamma look-up tables.
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x28
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        gamma_table_index = byte_list[0]
-        return gamma_table_index
+        return self._txn(0x28, _EMPTY, channel)
 
-    def set_CAIC_enable(self, CAIC_enabled, channel = LEFT):
+    def set_CAIC_enable(self, CAIC_enabled, channel = LEFT, defer = False):
         """ Enables or disables the Content Adaptive Illumination Control (CAIC) in the TI DLP controller.
             More information: https://www.ti.com/lit/an/dlpa058/dlpa058.pdf 
             parameters:
@@ -394,13 +719,9 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
         byte = 0
         if CAIC_enabled: byte += 1
-        cmd_id = 0x50
-        self._send_command(cmd_id, bytes([byte]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        return self._txn(0x50, bytes((byte,)), channel, defer)
     
     def get_CAIC_enable(self, channel = LEFT):
         """ Reads Content Adaptive Illumination Control (CAIC) enablement status.
@@ -410,13 +731,9 @@ class coretronics_venus3:
                 CAIC_enabled: True or 1 indicates that display image freezing is enabled
                 More information: https://www.ti.com/lit/an/dlpa058/dlpa058.pdf 
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x51
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        return (byte_list[0] & 1) > 0
+        return self._txn(0x51, _EMPTY, channel)
 
-    def set_RGB_enable(self, red_enabled, green_enabled, blue_enabled, channel = LEFT):
+    def set_RGB_enable(self, red_enabled, green_enabled, blue_enabled, channel = LEFT, defer = False):
         """ Enables or disables the individual R,G,B LEDs in the DLP light engine.
             parameters:
                 channel: LEFT, RIGHT or BOTH
@@ -426,15 +743,11 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
         byte = 0
         if red_enabled: byte += 1
         if green_enabled: byte += 2
         if blue_enabled: byte += 4
-        cmd_id = 0x52
-        self._send_command(cmd_id, bytes([byte]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        return self._txn(0x52, bytes((byte,)), channel, defer)
     
     def get_RGB_enable(self, channel = LEFT):
         """ Reads enablement status of the red, green, and blue LEDs in the DLP selected.
@@ -445,17 +758,9 @@ class coretronics_venus3:
                 green_enabled: True when the Green LED is enabled
                 blue_enabled:  True when the Blue LED is enabled
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x53
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        byte = byte_list[0]
-        red_enabled =   (byte & 0x01) > 0 
-        green_enabled = (byte & 0x02) > 0 
-        blue_enabled =  (byte & 0x04) > 0 
-        return red_enabled, green_enabled, blue_enabled
-
-    def set_RGB_currents(self, Red_current, Green_current, Blue_current, channel = LEFT):
+        return self._txn(0x53, _EMPTY, channel)
+
+    def set_RGB_currents(self, Red_current, Green_current, Blue_current, channel = LEFT, defer = False):
         """ Writes R,G,B LED currents for attached DLPs.
             parameters:
                 channel: LEFT, RIGHT, or BOTH
@@ -463,15 +768,10 @@ class coretronics_venus3:
                 Green_current: uint16, proportional to Green LED current.
                 Blue_current:  uint16, proportional to Blue LED current.
         """
-        for c in [Red_current, Green_current, Blue_current]:
-            assert isinstance(c, int), ValueError("R,G,B should be integers!")
-            assert (c>=12) and (c<=350), ValueError("R,G,B should be in the range of [12..350]!")
-
-        cmd_id = 0x54
-        payload = self._set_rgb(Red_current, Green_current, Blue_current)
-        self._send_command(cmd_id, payload, channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        for c in (Red_current, Green_current, Blue_current):
+            if not isinstance(c, int): raise TypeError("R,G,B should be integers!")
+            if not (12 <= c <= 350): raise ValueError("R,G,B should be in the range of [12..350]!")
+        return self._txn(0x54, self._set_rgb(Red_current, Green_current, Blue_current), channel, defer)
 
     def get_RGB_currents(self, channel = LEFT):
         """ Reads R,G,B LED currents from attached DLPs.
@@ -480,13 +780,9 @@ class coretronics_venus3:
             returns
                 [R,G,B] list of uint16s, proportional to LED currents.
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x55
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        return self._get_rgb(byte_list)
+        return self._txn(0x55, _EMPTY, channel)
 
-    def set_brightness_boost(self, sharpness, LABB_control, LABB_manual_setting, channel = LEFT):
+    def set_brightness_boost(self, sharpness, LABB_control, LABB_manual_setting, channel = LEFT, defer = False):
         """ Write control parameters for the TI DLP Local Area Brightness Boost (LABB) algorithm.
             More information: https://www.ti.com/lit/an/dlpa058/dlpa058.pdf
             parameters:
@@ -495,17 +791,13 @@ class coretronics_venus3:
                 LABB_control: 0: disabled, 1: manual, 2: automatic, using light sensor
                 LABB_manual_setting: byte
         """
-        for c in [sharpness, LABB_control, LABB_manual_setting]:
-            assert isinstance(c, int), ValueError("Parameters should be integers!")
-        assert (0 <= sharpness <= 15), ValueError("Parameter sharpness out of range!")
-        assert (0 <= LABB_control <= 2), ValueError("Parameter LABB_control out of range!")
-        assert (0 <= LABB_manual_setting <= 255), ValueError("Parameter LABB_manual_setting out of range!")
-
-        cmd_id = 0x80
-        payload = bytes([ (sharpness << 4) + LABB_control, LABB_manual_setting])
-        self._send_command(cmd_id, payload, channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        for c in (sharpness, LABB_control, LABB_manual_setting):
+            if not isinstance(c, int): raise TypeError("Parameters should be integers!")
+        if not (0 <= sharpness <= 15): raise ValueError("Parameter sharpness out of range!")
+        if not (0 <= LABB_control <= 2): raise ValueError("Parameter LABB_control out of range!")
+        if not (0 <= LABB_manual_setting <= 255): raise ValueError("Parameter LABB_manual_setting out of range!")
+        payload = bytes(((sharpness << 4) + LABB_control, LABB_manual_setting))
+        return self._txn(0x80, payload, channel, defer)
 
     def get_brightness_boost(self, channel = LEFT):
         """ Read control parameters for the TI DLP Local Area Brightness Boost (LABB) algorithm.
@@ -518,16 +810,7 @@ class coretronics_venus3:
                 LABB_manual_setting: byte
                 LABB_gain: byte
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0x81
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        byte_1 = byte_list[0]
-        sharpness = byte_1 >> 4
-        LABB_control = byte_1 & 0x03
-        LABB_manual_setting = byte_list[1] 
-        LABB_gain = byte_list[2]
-        return [sharpness, LABB_control, LABB_manual_setting, LABB_gain]
+        return self._txn(0x81, _EMPTY, channel)
 
     def get_ASIC_device_ID(self, channel = LEFT):
         """ Reads DLP driver device ID.
@@ -539,15 +822,7 @@ class coretronics_venus3:
                 1 : DLP3433
                 4 : DLP3435
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0xD4
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        device_id = byte_list[0]
-        if (device_id == 0): return 'DLP3430'
-        if (device_id == 1): return 'DLP3433'
-        if (device_id == 4): return 'DLP3435'
-        assert "Unknown device ID!"
+        return self._txn(0xD4, _EMPTY, channel)
 
     # Predefined DMD device types
     DMD_WVGA = "64000D60"
@@ -561,13 +836,7 @@ class coretronics_venus3:
                 DMD_device_ID: byte
                 type_code = hex string, DMD_WVGA or DMD_720p
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0xD5
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        device_id = byte_list[0] & 0x07
-        type = (byte_list[3] << 24) + (byte_list[2] << 16) + (byte_list[1] << 8) + byte_list[0]
-        return device_id, hex(type)[2:].upper()
+        return self._txn(0xD5, _EMPTY, channel)
 
     def get_DLP_flash_version(self, channel = LEFT):
         """ Reads DMD device ID and type
@@ -577,14 +846,9 @@ class coretronics_venus3:
                 DMD_device_ID: byte
                 version: hex string (major, minor, patch_MSB, patch_version_LSB)
         """
-        assert channel == self.LEFT or channel == self.RIGHT
-        cmd_id = 0xD9
-        self._send_command(cmd_id, bytes(), channel)
-        byte_list = self._read_response(cmd_id, channel)
-        version = "{0}.{1}.{2}".format( byte_list[3], byte_list[2], hex((byte_list[1] << 8) + byte_list[0])[2:].upper())
-        return version
+        return self._txn(0xD9, _EMPTY, channel)
 
-    def write_tint_to_flash(self, look_id, Red_current, Green_current, Blue_current, channel = LEFT):
+    def write_tint_to_flash(self, look_id, Red_current, Green_current, Blue_current, channel = LEFT, defer = False):
         """ Write look_id and LED drive currents to flash, changing default display tint after DLP boot.
             parameters:
                 look_id: byte
@@ -594,20 +858,15 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
-        assert isinstance(look_id, int), ValueError("look_id should be integer!")
-        assert 0 <= look_id <= 255, ValueError("look_id should be in the range of [0..255]!")
-        for c in [Red_current, Green_current, Blue_current]:
-            assert isinstance(c, int), ValueError("R,G,B should be integers!")
-            assert (c>=12) and (c<=350), ValueError("R,G,B should be in the range of [12..350]!")
+        if not isinstance(look_id, int): raise TypeError("look_id should be integer!")
+        if not (0 <= look_id <= 255): raise ValueError("look_id should be in the range of [0..255]!")
+        for c in (Red_current, Green_current, Blue_current):
+            if not isinstance(c, int): raise TypeError("R,G,B should be integers!")
+            if not (12 <= c <= 350): raise ValueError("R,G,B should be in the range of [12..350]!")
+        payload = _TINT_PACK(look_id, Red_current, Green_current, Blue_current)
+        return self._txn(0xF9, payload, channel, defer)
 
-        cmd_id = 0xF9
-        payload = bytearray([look_id]) + self._set_rgb(Red_current, Green_current, Blue_current)
-        self._send_command(cmd_id, payload, channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
-
-    def write_orientation_to_flash(self, flip_x, flip_y, channel = LEFT):
+    def write_orientation_to_flash(self, flip_x, flip_y, channel = LEFT, defer = False):
         """ Commit image orientation for the DLP(s) to flash,
             changing default display orientation  after DLP boot.
             parameters:
@@ -617,15 +876,141 @@ class coretronics_venus3:
             returns:
                 None
         """
-        assert channel == self.LEFT or channel == self.RIGHT or channel == self.BOTH
         byte = 0
         if flip_y: byte += 4
         if flip_x: byte += 2
-        cmd_id = 0xFA
-        self._send_command(cmd_id, bytes([0, byte]), channel)
-        void = self._read_response(cmd_id, channel, expect_only_ACK=True)        
-        return void
+        return self._txn(0xFA, bytes((0, byte)), channel, defer)
  
+class _BoundSide:
+    """ Channel-bound view of a driver, returned by bind(). Public methods
+        of the underlying driver are exposed with the channel argument
+        pre-applied; each forwarder is built once on first use and cached,
+        so repeated calls skip the per-call attribute resolution.
+    """
+
+    def __init__(self, dlp, channel):
+        self._dlp = dlp
+        self._channel = channel
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        forward = functools.partial(getattr(self._dlp, name), channel=self._channel)
+        self.__dict__[name] = forward
+        return forward
+
+
+class coretronics_venus3_async(coretronics_venus3):
+    ''' Asyncio variant of the driver, for overlapping serial round-trips
+        with other work (requires the pyserial-asyncio package). The public
+        API mirrors coretronics_venus3, but open() must be awaited once and
+        every command returns an awaitable:
+
+            dlp = coretronics_venus3_async()
+            await dlp.open()
+            await dlp.set_gamma(2)
+            gamma = await dlp.get_gamma()
+            await dlp.flush()
+    '''
+
+    def __init__(self):
+        self.ser = 0
+        self.PCBA_NAME = "Coretronics Venus3"
+        self.isOpen = False
+        self._reader = None
+        self._writer = None
+        self._pending = []
+        self._responses = [None]*256
+        self.crc_fun = _crc16_impl
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.isOpen = False
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    async def open(self):
+        """ Opens the serial port to the Coretronics device
+        """
+        assert serial_asyncio is not None, \
+            "pyserial-asyncio is required for coretronics_venus3_async!"
+        for port in list_ports.comports():
+            if port.description.startswith('EVK1XXX Virtual Com Port'):
+                self._reader, self._writer = await serial_asyncio.open_serial_connection(
+                    url = port.device,
+                    baudrate = 115200,
+                    parity = serial.PARITY_NONE,
+                    stopbits = serial.STOPBITS_ONE,
+                    bytesize = serial.EIGHTBITS)
+                self.isOpen = True
+                return True
+        raise RuntimeError("Coretronic Device Not Found!")
+
+    def _set_rgb(self, R,G,B):
+        # Snapshot instead of the shared scratch buffer: a set-RGB
+        # coroutine only renders its frame when awaited, so two coroutines
+        # created back to back must not alias one payload buffer.
+        return _RGB_PACK(R, G, B)
+
+    def _send_command(self, cmd_idx, payload, wg):
+        # StreamWriter.write only queues the frame; the event loop drains
+        # it, so commands pipeline naturally until the next await.
+        self._writer.write(self._build_frame(cmd_idx, payload, wg))
+
+    async def _read_line(self, eol):
+        line = await self._reader.readuntil(eol)
+        return _strip_debug_lines(line[:-len(eol)])
+
+    async def _read_response(self, cmd_id, channel, expect_only_ACK=False):
+        while 1:
+            resp = await self._read_line(eol=b'\0')
+            assert resp[0:1] == b'#', "First character of response [HEAD] expected to be '#'!"
+            tag = resp[1]
+            assert tag != 0x4E, "Command NACK received!"
+            if tag == 0x41:
+                if expect_only_ACK: return
+                slot = self._responses[cmd_id]
+                assert slot is not None, "Mismatch between queried command ID and response ID!"
+                self._responses[cmd_id] = None
+                wg, byte_list = slot
+                assert wg==int(channel), "Mismatch between command and response channel IDs!"
+                return byte_list
+            cmd, wg, byte_list = self._parse_response(resp)
+            self._responses[cmd] = (wg, byte_list)
+
+    async def _txn(self, cmd_id, payload, channel, defer=False):
+        allow_both, ack_only, decoder = _CMD_META[cmd_id]
+        if channel not in (self._CH_W if allow_both else self._CH_RW):
+            raise ValueError(channel)
+        if ack_only:
+            self._send_command(cmd_id, payload, channel)
+            self._pending.append((cmd_id, channel))
+            if not defer:
+                await self.flush()
+            return
+        await self.flush()
+        self._send_command(cmd_id, payload, channel)
+        return decoder(await self._read_response(cmd_id, channel))
+
+    async def flush(self):
+        """ Waits for the ACK of every deferred set-command issued so far.
+            Queries flush implicitly; call this after a batch of
+            defer=True set-commands to confirm the device accepted them all.
+        """
+        pending, self._pending = self._pending, []
+        for cmd_id, channel in pending:
+            await self._read_response(cmd_id, channel, expect_only_ACK=True)
+
 # ---------------------------------------------------
 # Demonstrate / test the coretronics_venus3 class
 # ---------------------------------------------------
@@ -638,9 +1023,10 @@ if __name__ == "__main__":
         look_id, sequence_id, frame_rate_int = dlp.get_look()
         # Test bule overdrive:
         dlp.write_tint_to_flash(look_id, Red_current = 200, Green_current = 200, Blue_current = 260)
-        DLP_driver_device_ID = dlp.get_ASIC_device_ID(dlp.LEFT)
-        DMD_driver_device_ID, type = dlp.get_DMD_device_ID(dlp.LEFT)
-        DLP_Flash_Version = dlp.get_DLP_flash_version(dlp.LEFT)
+        left = dlp.bind(dlp.LEFT)
+        DLP_driver_device_ID = left.get_ASIC_device_ID()
+        DMD_driver_device_ID, type = left.get_DMD_device_ID()
+        DLP_Flash_Version = left.get_DLP_flash_version()
         dlp.write_orientation_to_flash(flip_x = True, flip_y = True)
         dlp.set_image_orientation( flip_x=True, flip_y=False, rot_90=False )
         dlp.set_look(1)
@@ -649,11 +1035,13 @@ if __name__ == "__main__":
         flip_x, flip_y, rot_90 = dlp.get_image_orientation()
         dlp.set_input_source(dlp.TEST_PATTERN_GENERATOR)
         print(dlp.get_input_source())
-        dlp.set_test_pattern(dlp.COLOR_BARS)
-        dlp.set_RGB_currents(200, 200, 200)
+        # Batch consecutive set-commands into one round-trip window:
+        dlp.set_test_pattern(dlp.COLOR_BARS, defer=True)
+        dlp.set_RGB_currents(200, 200, 200, defer=True)
         print( dlp.get_RGB_currents() )
         dlp.set_input_source(dlp.EXTERNAL_VIDEO_PORT)
         frozen = dlp.get_image_freeze()
         dlp.set_image_freeze( freeze_enabled=True)
         frozen = dlp.get_image_freeze()
         dlp.set_image_freeze(freeze_enabled=False)
+        dlp.flush()
@@ -0,0 +1,16 @@
+'''
+Builds the optional Cython fast path for the Venus3 driver:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The driver works without it; when _venus3_fast is importable the CRC and
+frame assembly automatically switch to the compiled implementations.
+'''
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='coretronics',
+    ext_modules=cythonize('_venus3_fast.pyx'),
+)